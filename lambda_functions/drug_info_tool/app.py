@@ -2,6 +2,9 @@
 import json
 import requests
 
+# Initialize the HTTP session once so warm invocations reuse the openFDA connection
+session = requests.Session()
+
 def lambda_handler(event, context):
     # The agent sends parameters in a list. We find the one named 'drug_name'.
     parameters = event.get('parameters', [])
@@ -18,7 +21,7 @@ def lambda_handler(event, context):
     api_url = f"https://api.fda.gov/drug/label.json?search=(openfda.brand_name:\"{drug_name}\" OR openfda.generic_name:\"{drug_name}\")&limit=1"
 
     try:
-        response = requests.get(api_url, timeout=10)
+        response = session.get(api_url, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -49,8 +49,7 @@ def lambda_handler(event, context):
         # Get the JSON file from S3
         response = s3.get_object(Bucket=bucket_name, Key=file_key)
         print(f"[DEBUG] Successfully retrieved S3 object")
-        content = response['Body'].read().decode('utf-8')
-        protocol = json.loads(content)
+        protocol = json.loads(response['Body'].read())
         
         # Validate protocol structure
         if 'timeline' not in protocol: